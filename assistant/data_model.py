@@ -2,9 +2,10 @@
 
 from typing import List, Optional
 from dataclasses import dataclass
-from datetime import datetime, date
+from datetime import date
+from enum import Enum
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a single task in the todo list."""
     title: str
@@ -30,19 +31,31 @@ class Task:
     @classmethod
     def from_dict(cls, data: dict):
         """Create Task from a dictionary (JSON deserialization)."""
-        future_date = None
-        if data.get("future_date"):
+        future_date = data.get("future_date")
+        # fromisoformat also takes "20270102" and "2027-W01-1"; only YYYY-MM-DD is ours
+        if (
+            isinstance(future_date, str) and len(future_date) == 10
+            and future_date[4] == "-" and future_date[7] == "-"
+        ):
             try:
-                future_date = datetime.strptime(data["future_date"], "%Y-%m-%d").date()
-            except ValueError:
-                pass  # Invalid date format, keep as None
+                future_date = date.fromisoformat(future_date)
+            except (ValueError, TypeError):
+                future_date = None  # Invalid date format
+        else:
+            future_date = None
 
         return cls(
-            title=data["title"],
-            description=data["description"],
-            resolved=data["resolved"],
-            future_date=future_date
+            data["title"],
+            data.get("description", ""),
+            data.get("resolved", False),
+            future_date
         )
 
     def __repr__(self):
         return f"Task(title={self.title}, resolved={self.resolved})"
+
+
+class ReviewDecision(Enum):
+    KEEP = "keep"      # [R] - default state
+    REOPEN = "reopen"  # [+]
+    DELETE = "delete"  # [D]
@@ -3,6 +3,11 @@
 from .todo_app import TodoApp
 
 def main():
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass  # uvloop is optional (and unavailable on Windows)
     app = TodoApp()
     app.run()
 
@@ -2,54 +2,259 @@
 
 import os
 import json
-import datetime
-from typing import List
+import time
+import logging
+import itertools
+import threading
+from typing import List, Tuple
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
 
 from .data_model import Task
 
+# JSON codec, picked once at import time
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+
+    def _dumps_line(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+else:
+    _json_encoder = json.JSONEncoder(separators=(",", ":"))
+
+    def _dumps(data) -> bytes:
+        return _json_encoder.encode(data).encode("utf-8")
+
+    def _dumps_line(data) -> bytes:
+        return (_json_encoder.encode(data) + "\n").encode("utf-8")
+
+    _loads = json.loads
+
+logger = logging.getLogger(__name__)
+
 TASKS_FILE = "tasks.json"
-LOGS_FILE = "logs.json"
+LOGS_FILE = "logs.ndjson"
+LEGACY_LOGS_FILE = "logs.json"  # Whole-array log format used before logs.ndjson
+
+# Serializes writers so a background save and a shutdown save never interleave
+_write_lock = threading.RLock()
+
+# Last tasks payload read from or written to disk, used to skip no-op writes
+_last_tasks_bytes = None
+
+# Generation numbers order task snapshots; a write older than the last one is dropped
+_tasks_generations = itertools.count(1)
+_written_generation = 0
+
+# Append handle for the log file, kept open between open_log() and close_log()
+_log_fp = None
+
+# Last formatted log timestamp, reused while the wall-clock second is unchanged
+_last_ts_sec = 0
+_last_ts_str = ""
+
+
+def _keep_backup(path: str):
+    """Hard-link the current file to path.bak before it gets replaced."""
+    if not os.path.exists(path):
+        return  # Nothing to back up; keep whatever .bak is already there
+    backup = path + ".bak"
+    try:
+        if os.path.exists(backup):
+            os.remove(backup)
+        os.link(path, backup)
+    except OSError:
+        pass  # Links unsupported
+
+
+def _atomic_write(path: str, data: bytes, backup: bool = False):
+    """Write data to a synced temporary file and rename it over path."""
+    tmp = path + ".tmp"
+    with _write_lock:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if backup:
+            _keep_backup(path)
+        os.replace(tmp, path)
+
+
+def _now_str() -> str:
+    """Return the current local time formatted for log entries."""
+    global _last_ts_sec, _last_ts_str
+    t = int(time.time())
+    if t != _last_ts_sec:
+        _last_ts_sec = t
+        _last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t))
+    return _last_ts_str
+
+
+def _set_aside(path: str):
+    """Rename an unparseable file so later saves cannot overwrite it."""
+    try:
+        os.replace(path, f"{path}.corrupt.{int(time.time())}")
+    except OSError:
+        pass
+
+
+def _parse_tasks(raw: bytes) -> List[Task]:
+    data = _loads(raw)
+    if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+        raise ValueError("expected a JSON list of task objects")
+    return [Task.from_dict(item) for item in data]
+
+
+def _load_backup_tasks() -> List[Task]:
+    """Restore tasks from the backup kept by the previous save, if usable."""
+    global _last_tasks_bytes
+    try:
+        with open(TASKS_FILE + ".bak", "rb") as f:
+            raw = f.read()
+        tasks = _parse_tasks(raw)
+    except (OSError, ValueError, KeyError, TypeError):
+        return []
+    # Put the recovered tasks back in place so the next launch and the next
+    # save's backup both start from them rather than from a missing file
+    try:
+        _atomic_write(TASKS_FILE, raw)
+    except OSError as e:
+        logger.warning("Could not restore %s from backup: %s", TASKS_FILE, e)
+    else:
+        _last_tasks_bytes = raw
+    return tasks
 
 
 def load_tasks() -> List[Task]:
     """Load tasks from JSON file."""
-    if not os.path.exists(TASKS_FILE):
-        return []
+    global _last_tasks_bytes
     try:
-        with open(TASKS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return [Task.from_dict(item) for item in data]
-    except:
+        with open(TASKS_FILE, "rb") as f:
+            raw = f.read()
+    except OSError:
         return []
+    if not raw:
+        return []
+    try:
+        tasks = _parse_tasks(raw)
+    except (ValueError, KeyError, TypeError) as e:
+        # Invalid JSON or malformed task entries
+        logger.warning("Could not load %s: %s", TASKS_FILE, e)
+        _set_aside(TASKS_FILE)
+        return _load_backup_tasks()
+    _last_tasks_bytes = raw
+    return tasks
+
+
+def encode_tasks(tasks: List[Task]) -> Tuple[int, bytes]:
+    """Serialize tasks to the tasks.json payload, tagged with its generation."""
+    if orjson is not None:
+        data = tasks  # orjson encodes the Task dataclass and its date natively
+    else:
+        data = [t.to_dict() for t in tasks]
+    return next(_tasks_generations), _dumps(data)
+
+
+def write_tasks(generation: int, data: bytes):
+    """Write an encoded tasks payload unless it is unchanged or a newer one was written."""
+    global _last_tasks_bytes, _written_generation
+    with _write_lock:
+        if generation <= _written_generation:
+            return  # Stale snapshot; a later save already reached the disk
+        _written_generation = generation
+        if data == _last_tasks_bytes:
+            return
+        _atomic_write(TASKS_FILE, data, backup=True)
+        _last_tasks_bytes = data
 
 
 def save_tasks(tasks: List[Task]):
     """Persist tasks to JSON file."""
-    data = [t.to_dict() for t in tasks]
-    with open(TASKS_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    write_tasks(*encode_tasks(tasks))
 
 
-def load_logs() -> List[str]:
-    """Load log entries from JSON file."""
-    if not os.path.exists(LOGS_FILE):
+def _migrate_legacy_logs() -> List[str]:
+    """Convert a logs.json array into logs.ndjson, once, and return its entries."""
+    try:
+        with open(LEGACY_LOGS_FILE, "rb") as f:
+            logs = _loads(f.read())
+    except (OSError, ValueError):
+        return []
+    if not isinstance(logs, list):
         return []
+    logs = [entry for entry in logs if isinstance(entry, str)]
+    save_logs(logs)
+    try:
+        os.replace(LEGACY_LOGS_FILE, LEGACY_LOGS_FILE + ".migrated")
+    except OSError:
+        pass
+    return logs
+
+
+def load_logs() -> List[str]:
+    """Load log entries from the line-delimited JSON log file."""
     try:
-        with open(LOGS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except:
+        with open(LOGS_FILE, "rb") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return _migrate_legacy_logs()
+    except OSError:
         return []
+    logs = []
+    skipped = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            entry = _loads(line)
+        except ValueError:
+            entry = None
+        if isinstance(entry, str):
+            logs.append(entry)
+        else:
+            skipped += 1  # Torn final write or foreign data; keep the rest
+    if skipped:
+        logger.warning("Skipped %d unreadable entries in %s", skipped, LOGS_FILE)
+    return logs
 
 
 def save_logs(logs: List[str]):
-    """Persist log entries to JSON file."""
-    with open(LOGS_FILE, "w", encoding="utf-8") as f:
-        json.dump(logs, f, indent=2)
+    """Rewrite the whole log file, one JSON-encoded entry per line."""
+    _atomic_write(LOGS_FILE, b"".join(_dumps_line(entry) for entry in logs))
+
 
+def open_log():
+    """Open the log file for appending for the rest of the session."""
+    global _log_fp
+    if _log_fp is None:
+        _log_fp = open(LOGS_FILE, "ab", buffering=65536)
 
-def log_action(logs: List[str], message: str):
-    """Add timestamped log entry and persist."""
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    entry = f"[{timestamp}] {message}"
+
+def flush_log():
+    """Push buffered log entries to the OS without closing the handle."""
+    if _log_fp is not None:
+        _log_fp.flush()
+
+
+def close_log():
+    """Flush and close the session log handle."""
+    global _log_fp
+    if _log_fp is not None:
+        _log_fp.close()
+        _log_fp = None
+
+
+def log_action(logs: List[str], message: str) -> str:
+    """Add timestamped log entry, append it to the log file and return it."""
+    entry = f"[{_now_str()}] {message}"
+    line = _dumps_line(entry)
+    if _log_fp is not None:
+        _log_fp.write(line)
+    else:
+        with open(LOGS_FILE, "ab") as f:
+            f.write(line)
     logs.append(entry)
-    save_logs(logs)
+    return entry
@@ -1,19 +1,12 @@
 from textual.screen import Screen
 from textual.widgets import ListView, Label
 from textual import events
-import logging
 from typing import List
-from enum import Enum
 
-from .data_model import Task
+from .data_model import Task, ReviewDecision
 from .textual_widgets import ReviewTaskItem
 from .task_screen import TaskScreen, TaskScreenResult
 
-class ReviewDecision(Enum):
-    KEEP = "keep"      # [R] - default state
-    REOPEN = "reopen"  # [+]
-    DELETE = "delete"  # [D]
-
 class ReviewScreen(Screen):
     """Screen for reviewing resolved tasks."""
     
@@ -36,10 +29,17 @@ class ReviewScreen(Screen):
     
     def __init__(self, tasks: List[Task]):
         super().__init__()
-        self.tasks = [task for task in tasks if task.resolved]
-        self.decisions = {task: ReviewDecision.KEEP for task in self.tasks}
+        self.tasks = []
+        self._source_indices = []  # Position of each reviewed task in the app's task list
+        for index, task in enumerate(tasks):
+            if task.resolved:
+                self.tasks.append(task)
+                self._source_indices.append(index)
+        self._source_count = len(tasks)
+        self.decisions = [ReviewDecision.KEEP] * len(self.tasks)
+        self._max_index = len(self.tasks) - 1  # Review never adds or removes rows
+        self._items: List[ReviewTaskItem] = []  # Row widgets, parallel to self.tasks
         self.list_view = ListView()
-        self.logger = logging.getLogger(__name__)
 
     def compose(self):
         yield Label("Task Review", id="header")
@@ -50,68 +50,84 @@ class ReviewScreen(Screen):
         self._refresh_list()
         self.list_view.focus()
 
-    class MoveCursor(events.Message):
-        """Message to move cursor to specific position."""
-        def __init__(self, target_index: int) -> None:
-            super().__init__()
-            self.target_index = target_index
-
-    async def on_review_screen_move_cursor(self, message: MoveCursor) -> None:
-        """Handle cursor movement message."""
-        if self.list_view:
-            self.list_view.index = message.target_index
-            self.list_view.focus()
-
-    async def on_key(self, event: events.Key) -> None:
+    def on_key(self, event: events.Key) -> None:
         """Handle key events for the review screen."""
-        if event.key in ("e", "o", "enter"):
-            await self.open_task_screen(focus_description=False)
-            return True
-        elif event.key == "E":
-            await self.open_task_screen(focus_description=True)
-            return True
-        elif event.key == "R":
-            event.stop()
-            event.prevent_default()
-            self.action_apply()
-            return True
-        elif event.key in ("q", "escape"):
-            event.stop()
-            event.prevent_default()
-            self.action_cancel()
-            return True
-        elif event.key in ("j"):
-            if self.list_view:
-                self.list_view.index = (
-                    min(self.list_view.index + 1, len(self.tasks) - 1) 
-                    if self.list_view.index is not None 
-                    else 0
-                )
-                self.list_view.focus()
-        elif event.key in ("k"):
-            if self.list_view:
-                self.list_view.index = (
-                    max(0, self.list_view.index - 1) 
-                    if self.list_view.index is not None 
-                    else 0
-                )
-                self.list_view.focus()
-        elif event.key == "space":
-            self.action_toggle_reopen()
-        elif event.key == "d":
-            self.action_toggle_delete()
+        handler = self._KEY_HANDLERS.get(event.key)
+        if handler is not None:
+            handler(self, event)
         return True  # Capture all other keys to prevent them from reaching the main app
 
+    def _key_edit_title(self, event: events.Key) -> None:
+        # Stop the key here: the task screen is pushed later and must not see it
+        event.stop()
+        event.prevent_default()
+        self.call_later(self.open_task_screen, focus_description=False)
+
+    def _key_edit_description(self, event: events.Key) -> None:
+        event.stop()
+        event.prevent_default()
+        self.call_later(self.open_task_screen, focus_description=True)
+
+    def _key_apply(self, event: events.Key) -> None:
+        event.stop()
+        event.prevent_default()
+        self.action_apply()
+
+    def _key_cancel(self, event: events.Key) -> None:
+        event.stop()
+        event.prevent_default()
+        self.action_cancel()
+
+    def _key_cursor_down(self, event: events.Key) -> None:
+        event.stop()
+        list_view = self.list_view
+        index = list_view.index
+        list_view.index = 0 if index is None else min(index + 1, self._max_index)
+        if not list_view.has_focus:
+            list_view.focus()
+
+    def _key_cursor_up(self, event: events.Key) -> None:
+        event.stop()
+        list_view = self.list_view
+        index = list_view.index
+        list_view.index = 0 if index is None else max(0, index - 1)
+        if not list_view.has_focus:
+            list_view.focus()
+
+    def _key_toggle_reopen(self, event: events.Key) -> None:
+        self.action_toggle_reopen()
+
+    def _key_toggle_delete(self, event: events.Key) -> None:
+        self.action_toggle_delete()
+
+    # Key -> handler
+    _KEY_HANDLERS = {
+        "e": _key_edit_title,
+        "o": _key_edit_title,
+        "enter": _key_edit_title,
+        "E": _key_edit_description,
+        "R": _key_apply,
+        "q": _key_cancel,
+        "escape": _key_cancel,
+        "j": _key_cursor_down,
+        "k": _key_cursor_up,
+        "space": _key_toggle_reopen,
+        "d": _key_toggle_delete,
+    }
+
     def _refresh_list(self):
         """Refresh the list view with current states."""
         current_index = self.list_view.index
         self.list_view.clear()
-        for index, task in enumerate(self.tasks):
-            decision = self.decisions[task]
-            self.list_view.append(ReviewTaskItem(task, index, decision))
+        # Mount all rows in one batch rather than one append per task
+        self._items = [
+            ReviewTaskItem(task, index, decision)
+            for index, (task, decision) in enumerate(zip(self.tasks, self.decisions))
+        ]
+        self.list_view.extend(self._items)
         
         if current_index is not None:
-            self.post_message(self.MoveCursor(current_index))
+            self.list_view.index = current_index
 
     def _update_item(self, index: int) -> None:
         """Update single item in the list view."""
@@ -119,24 +135,18 @@ class ReviewScreen(Screen):
             return
             
         task = self.tasks[index]
-        decision = self.decisions[task]
+        decision = self.decisions[index]
         
-        # Get existing item and update it in place
-        existing_item = self.list_view.children[index]
-        if isinstance(existing_item, ReviewTaskItem):
-            existing_item.update_content(task=task, decision=decision)
-        
-        # Also post message to ensure consistent state
-        self.post_message(self.MoveCursor(index))
+        # Update the existing row in place
+        self._items[index].update_content(task=task, decision=decision)
 
     def action_toggle_reopen(self) -> None:
         """Toggle reopen state for the selected task."""
         if self.list_view.index is None:
             return
         current_index = self.list_view.index
-        task = self.tasks[current_index]
-        current = self.decisions[task]
-        self.decisions[task] = (
+        current = self.decisions[current_index]
+        self.decisions[current_index] = (
             ReviewDecision.KEEP if current == ReviewDecision.REOPEN 
             else ReviewDecision.REOPEN
         )
@@ -147,9 +157,8 @@ class ReviewScreen(Screen):
         if self.list_view.index is None:
             return
         current_index = self.list_view.index
-        task = self.tasks[current_index]
-        current = self.decisions[task]
-        self.decisions[task] = (
+        current = self.decisions[current_index]
+        self.decisions[current_index] = (
             ReviewDecision.KEEP if current == ReviewDecision.DELETE 
             else ReviewDecision.DELETE
         )
@@ -159,16 +168,33 @@ class ReviewScreen(Screen):
         """Handle Escape key to exit review mode."""
         self.app.pop_screen()
 
+    class TaskEdited(events.Message):
+        """Message indicating that a task was edited in place during review."""
+        __slots__ = ()
+
     class ReviewComplete(events.Message):
-        """Message containing the review results."""
-        def __init__(self, decisions: dict[Task, ReviewDecision]) -> None:
+        """Message containing the review results.
+
+        Both masks are aligned to the task list the screen was opened with.
+        """
+        __slots__ = ("delete_mask", "reopen_mask")
+
+        def __init__(self, delete_mask: List[bool], reopen_mask: List[bool]) -> None:
             super().__init__()
-            self.decisions = decisions
+            self.delete_mask = delete_mask
+            self.reopen_mask = reopen_mask
 
     def action_apply(self) -> None:
         """Apply all review decisions and exit review mode."""
+        delete_mask = [False] * self._source_count
+        reopen_mask = [False] * self._source_count
+        for index, decision in zip(self._source_indices, self.decisions):
+            if decision is ReviewDecision.DELETE:
+                delete_mask[index] = True
+            elif decision is ReviewDecision.REOPEN:
+                reopen_mask[index] = True
         # First post the review complete message
-        self.post_message(self.ReviewComplete(self.decisions))
+        self.post_message(self.ReviewComplete(delete_mask, reopen_mask))
         # Then post a message to update the handling state before popping the screen
         self.app.pop_screen()
 
@@ -195,4 +221,5 @@ class ReviewScreen(Screen):
         task.title = message.title
         task.description = message.description
         # Refresh the display
-        self._update_item(current_index)
\ No newline at end of file
+        self._update_item(current_index)
+        self.post_message(self.TaskEdited())
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 import logging
 from typing import Optional
-from datetime import datetime, date
+from datetime import date
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Label, Input
@@ -10,8 +10,12 @@ from textual import events
 
 from .data_model import Task
 
+logger = logging.getLogger(__name__)
+
 class TaskScreenResult(events.Message):
     """Message containing the result of TaskScreen operations."""
+    __slots__ = ("cancelled", "title", "description", "future_date")
+
     def __init__(self, cancelled: bool, title: str = "", description: str = "", future_date: Optional[date] = None) -> None:
         super().__init__()
         self.cancelled = cancelled
@@ -19,10 +23,6 @@ class TaskScreenResult(events.Message):
         self.description = description
         self.future_date = future_date
 
-class TaskScreenComplete(events.Message):
-    """Message indicating that task screen processing is complete."""
-    pass
-
 class TaskScreen(Screen):
     """Screen for adding or editing tasks."""
     BINDINGS = [
@@ -36,35 +36,40 @@ class TaskScreen(Screen):
         self._focus_description = focus_description
         self._parent_screen = parent_screen  # Store the parent screen reference
 
+        # Inputs are created in compose(); keep only their starting values here
+        self._initial_title = ""
+        self._initial_desc = ""
+        self._initial_date = ""
+        if task:
+            self._initial_title = task.title
+            self._initial_desc = task.description
+            if task.future_date:
+                self._initial_date = task.future_date.strftime("%d.%m.%Y")
+
+    def on_mount(self):
+        """Called once the screen is mounted."""
+        if self._focus_description:
+            self.desc_input.focus()
+        else:
+            self.title_input.focus()
+
+    def compose(self) -> ComposeResult:
         self.title_input = Input(
+            value=self._initial_title,
             placeholder="Title (required)",
             select_on_focus=False
         )
         self.desc_input = Input(
+            value=self._initial_desc,
             placeholder="Description (optional)",
             select_on_focus=False
         )
         self.date_input = Input(
+            value=self._initial_date,
             placeholder="Future date (DD.MM.YYYY, optional)",
             select_on_focus=False
         )
 
-        if task:
-            self.title_input.value = task.title
-            self.desc_input.value = task.description
-            if task.future_date:
-                self.date_input.value = task.future_date.strftime("%d.%m.%Y")
-
-        self.logger = logging.getLogger(__name__)
-
-    def on_mount(self):
-        """Called once the screen is mounted."""
-        if self._focus_description:
-            self.desc_input.focus()
-        else:
-            self.title_input.focus()
-
-    def compose(self) -> ComposeResult:
         yield Label("Task Details")
         yield Label("Title:")
         yield self.title_input
@@ -73,7 +78,7 @@ class TaskScreen(Screen):
         yield Label("Future date (optional):")
         yield self.date_input
 
-    async def on_key(self, event: events.Key) -> None:
+    def on_key(self, event: events.Key) -> None:
         """Handle key events for the task screen."""
         if event.key == "enter":
             event.stop()  # Stop event propagation
@@ -89,16 +94,23 @@ class TaskScreen(Screen):
         date_str = self.date_input.value.strip()
 
         if not title:
-            self.logger.debug("Title is required, submission aborted")
+            logger.debug("Title is required, submission aborted")
             return  # Title is required
 
         future_date = None
         if date_str:
             try:
-                future_date = datetime.strptime(date_str, "%d.%m.%Y").date()
-                self.logger.debug(f"Parsed future date: {future_date}")
+                day, month, year = date_str.split(".")
+                # Same shape strptime("%d.%m.%Y") accepted: 1-2 digit day/month, 4 digit year
+                if not (
+                    1 <= len(day) <= 2 and 1 <= len(month) <= 2 and len(year) == 4
+                    and day.isdigit() and month.isdigit() and year.isdigit()
+                ):
+                    raise ValueError(date_str)
+                future_date = date(int(year), int(month), int(day))
+                logger.debug("Parsed future date: %s", future_date)
             except ValueError:
-                self.logger.debug(f"Invalid date format: {date_str}")
+                logger.debug("Invalid date format: %s", date_str)
                 # Continue without the date if it's invalid
 
         result = TaskScreenResult(
@@ -119,7 +131,7 @@ class TaskScreen(Screen):
 
     def action_cancel(self) -> None:
         """Handle Escape key for canceling task add/edit."""
-        self.logger.debug("Cancel action triggered")
+        logger.debug("Cancel action triggered")
         result = TaskScreenResult(cancelled=True)
         
         # If we have a parent screen, post directly to it
@@ -1,15 +1,31 @@
 # assistant/textual_widgets.py
 
-from textual.widgets import ListItem, Label, Static
-from textual.containers import Vertical, Horizontal
-from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.widgets import ListItem, ListView, Label
 from typing import Optional
-import logging
 
-from .data_model import Task
+from .data_model import Task, ReviewDecision
+
+# Row prefixes for TaskItem.render_text
+_RESOLVED_PREFIX = "[R] "
+_UNRESOLVED_PREFIX = " "
+
+class TaskListView(ListView):
+    """The main task list.
+
+    Enter goes to the app's edit action rather than posting Selected,
+    which ListView also posts on a mouse click.
+    """
+
+    BINDINGS = [
+        Binding("enter", "app.edit_title", "Edit task", show=False),
+    ]
+
 
 class TaskItem(ListItem):
     """A ListItem representing a single task row in the ListView."""
+
+    __slots__ = ("_task_item", "_cached_key", "_label")
     
     DEFAULT_CSS = """
     TaskItem {
@@ -33,10 +49,10 @@ class TaskItem(ListItem):
     }
     """
     
-    def __init__(self, task: Task, index: int):
+    def __init__(self, task: Task):
         # Create the label with initial text
-        self._task = task
-        self._index = index
+        self._task_item = task
+        self._cached_key = self._render_key()
         self._label = Label(self.render_text())
         # Call super with the label
         super().__init__(self._label)
@@ -47,34 +63,41 @@ class TaskItem(ListItem):
 
     def render_text(self) -> str:
         """Return a text representation of this task, with a marker if resolved."""
-        marker = "[R]" if self._task.resolved else ""
-        return f"{marker} {self._task.title}"
+        prefix = _RESOLVED_PREFIX if self._task_item.resolved else _UNRESOLVED_PREFIX
+        return prefix + self._task_item.title
 
     @property
     def task(self) -> Task:
-        return self._task
+        return self._task_item
 
-    @property
-    def index(self) -> int:
-        return self._index
+    def rebind(self, task: Task) -> None:
+        """Show a different task in this row."""
+        self._task_item = task
+        self.update_content()
+
+    def _render_key(self) -> tuple:
+        """Return the task state that determines how this row looks."""
+        task = self._task_item
+        return (task.title, task.resolved, task.is_future_task())
 
     def update_content(self):
         """Update the displayed content if the task changes."""
+        key = self._render_key()
+        if key == self._cached_key:
+            return
+        self._cached_key = key
         self._label.update(self.render_text())
         
-        # Remove all state classes first
-        self.remove_class("-resolved")
-        self.remove_class("-future")
-        
-        # Add appropriate class based on task state
-        if self._task.resolved:
-            self.add_class("-resolved")
-        elif self._task.is_future_task():
-            self.add_class("-future")
+        # Set state classes from the render key (title, resolved, is_future)
+        _, resolved, is_future = key
+        self.set_class(resolved, "-resolved")
+        self.set_class(is_future and not resolved, "-future")
 
 
 class ReviewTaskItem(ListItem):
     """A ListItem representing a task in review mode."""
+
+    __slots__ = ("_task_item", "_index", "_decision", "_cached_key", "_label")
     
     DEFAULT_CSS = """
     ReviewTaskItem {
@@ -93,13 +116,19 @@ class ReviewTaskItem(ListItem):
     }
     """
     
-    def __init__(self, task: Task, index: int, decision: 'ReviewDecision'):
+    _MARKERS = {
+        ReviewDecision.KEEP: "[R]",
+        ReviewDecision.REOPEN: "[+]",
+        ReviewDecision.DELETE: "[D]",
+    }
+
+    def __init__(self, task: Task, index: int, decision: ReviewDecision):
         # Initialize task and decision before calling super()
         self._task_item = task  # Changed from _task to _task_item to avoid conflict
         self._index = index
         self._decision = decision
+        self._cached_key = self._render_key()
         self._label = Label(self.render_text())
-        self.logger = logging.getLogger(__name__)  # Add logger initialization
         super().__init__(self._label)
         
         # Add appropriate CSS class based on decision
@@ -110,13 +139,7 @@ class ReviewTaskItem(ListItem):
 
     def render_text(self) -> str:
         """Return a text representation of this task."""
-        markers = {
-            "keep": "[R]",
-            "reopen": "[+]",
-            "delete": "[D]"
-        }
-        marker = markers[self._decision.value]
-        return f"{marker} {self._task_item.title}"  # Changed from _task to _task_item
+        return f"{self._MARKERS[self._decision]} {self._task_item.title}"
 
     @property
     def task(self) -> Task:
@@ -126,22 +149,25 @@ class ReviewTaskItem(ListItem):
     def index(self) -> int:
         return self._index
 
-    def update_content(self, task: Optional[Task] = None, decision: Optional['ReviewDecision'] = None) -> None:
+    def _render_key(self) -> tuple:
+        """Return the state that determines this row's label text."""
+        return (self._decision, self._task_item.title)
+
+    def update_content(self, task: Optional[Task] = None, decision: Optional[ReviewDecision] = None) -> None:
         """Update the item's content and/or decision state."""
         if task is not None:
             self._task_item = task
-        if decision is not None:
+        decision_changed = decision is not None and decision is not self._decision
+        if decision_changed:
             self._decision = decision
         
-        # Update the label text
-        new_text = self.render_text()
-        self._label.update(new_text)
-        
-        # Update CSS classes
-        self.remove_class("-reopen")
-        self.remove_class("-delete")
+        # Update the label text only if it would change
+        key = self._render_key()
+        if key != self._cached_key:
+            self._cached_key = key
+            self._label.update(self.render_text())
         
-        if self._decision.value == "reopen":
-            self.add_class("-reopen")
-        elif self._decision.value == "delete":
-            self.add_class("-delete")
+        # Update CSS classes; set_classes() would also drop ListView's -highlight
+        if decision_changed:
+            self.set_class(decision is ReviewDecision.REOPEN, "-reopen")
+            self.set_class(decision is ReviewDecision.DELETE, "-delete")
@@ -1,28 +1,43 @@
 # assistant/todo_app.py
 
 import sys
+import asyncio
 import logging
 import datetime
-from typing import Optional
+from typing import List, Optional
 
 from textual.app import App, ComposeResult
+from textual.binding import Binding
 from textual.screen import Screen
 from textual.widgets import ListView, RichLog, Label
-from textual.containers import Container
-from textual.reactive import reactive
-from textual import events
 
 from .data_model import Task
 from .persistence import (
     load_tasks,
     save_tasks,
+    encode_tasks,
+    write_tasks,
     load_logs,
-    save_logs,
-    log_action
+    log_action,
+    open_log,
+    flush_log,
+    close_log,
 )
-from .textual_widgets import TaskItem
-from .task_screen import TaskScreen, TaskScreenResult, TaskScreenComplete
-from .review_screen import ReviewScreen, ReviewDecision
+from .textual_widgets import TaskItem, TaskListView
+from .task_screen import TaskScreen, TaskScreenResult
+from .review_screen import ReviewScreen
+
+def _configure_logging() -> None:
+    """Send debug logging to debug.log, once per process."""
+    if logging.getLogger().handlers:
+        return
+    mode = 'a' if '--release' in sys.argv else 'w'
+    logging.basicConfig(
+        filename='debug.log',
+        filemode=mode,
+        level=logging.DEBUG,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
 
 class TodoApp(App):
     """Main TUI Application."""
@@ -46,171 +61,271 @@ class TodoApp(App):
         width: 100%;
         height: 2;
     }
-    """
 
-    # Reactive state
-    tasks = reactive(load_tasks())
-    logs = reactive(load_logs())
+    #log_panel {
+        dock: bottom;
+        height: 10;
+        border-top: solid #00dd00;
+    }
+    """
 
     # Screens
     SCREENS = {
         "add_task": TaskScreen,
     }
 
+    BINDINGS = [
+        Binding("A", "add_above", "Add task above"),
+        Binding("a", "add_below", "Add task below"),
+        Binding("j", "cursor_down", "Cursor down"),
+        Binding("k", "cursor_up", "Cursor up"),
+        Binding("J", "move_down", "Move task down"),
+        Binding("K", "move_up", "Move task up"),
+        Binding("d", "delete_task", "Delete task"),
+        Binding("r", "resolve_task", "Resolve/unresolve task"),
+        Binding("e,o,enter", "edit_title", "Edit task"),
+        Binding("E", "edit_description", "Edit description"),
+        Binding("L", "toggle_log", "Toggle log"),
+        Binding("R", "review", "Review resolved tasks"),
+        Binding("q,escape", "exit_app", "Quit"),
+    ]
+    # Actions that only apply to the main task list; Textual's own ctrl+q
+    # "quit" stays available on every screen
+    _MAIN_ACTIONS = frozenset(binding.action for binding in BINDINGS)
+    # Entries kept in the log panel; older history stays in logs.ndjson only
+    _LOG_PANEL_LINES = 200
+
     log_panel: Optional[RichLog] = None
     list_view: Optional[ListView] = None
 
     def __init__(self):
         super().__init__()
-        mode = 'a' if '--release' in sys.argv else 'w'
-        logging.basicConfig(
-            filename='debug.log',
-            filemode=mode,
-            level=logging.DEBUG,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
+        _configure_logging()
         self.logger = logging.getLogger(__name__)
         self.logger.debug("TodoApp initialized")
 
-        # Load tasks
-        self.tasks = load_tasks()
+        # Persisted state, loaded once in on_mount
+        self.tasks: List[Task] = []
+        self.logs: List[str] = []
 
         # Additional instance variables
         self._editing_task = None
         self._insert_above = False
-        self._handling_task_screen = False
-        self._handling_review_screen = False
+        # Modal screens currently open: "task" and/or "review". One set rather
+        # than a flag per screen so the binding check reads a single attribute
+        self._active_modals = set()
+        self._tasks_dirty = False
+        self._tasks_version = 0  # Bumped on every change to self.tasks
+        self._review_tasks_version = 0  # _tasks_version when review was opened
+        self._save_timer = None
 
     def compose(self) -> ComposeResult:
-        current_date = datetime.datetime.now().strftime("%d.%m.%Y")
-        yield Label(f"Alex Assistant - Main Menu ({current_date})", id="header")
-        with Container():
-            yield ListView()  # Don't assign to self.list_view here
+        self._header = Label(self._header_text(), id="header")
+        yield self._header
+        self.list_view = TaskListView()
+        yield self.list_view
+
+    @staticmethod
+    def _header_text() -> str:
+        return f"Alex Assistant - Main Menu ({datetime.date.today():%d.%m.%Y})"
+
+    def _schedule_header_refresh(self) -> None:
+        """Re-render the header date once, just after the next midnight."""
+        now = datetime.datetime.now()
+        midnight = datetime.datetime.combine(now.date() + datetime.timedelta(days=1), datetime.time())
+        self.set_timer((midnight - now).total_seconds() + 1, self._refresh_header)
+
+    def _refresh_header(self) -> None:
+        self._header.update(self._header_text())
+        self._schedule_header_refresh()
 
     async def on_mount(self) -> None:
         """Called once the app is fully loaded."""
-        self.list_view = self.query_one(ListView)  # Get reference to ListView here
+        self.tasks = await asyncio.to_thread(load_tasks)
+        self.logs = await asyncio.to_thread(load_logs)
+        open_log()
+        self._schedule_header_refresh()
         await self.update_list_view()
         if self.list_view:
             self.list_view.focus()
-        
-        save_tasks(self.tasks)
-        save_logs(self.logs)
+
+    def _mark_dirty_tasks(self) -> None:
+        """Flag tasks as changed and schedule a single coalesced save."""
+        self._tasks_dirty = True
+        self._tasks_version += 1
+        if self._save_timer is None:
+            self._save_timer = self.set_timer(0.25, self._flush_tasks_async)
+
+    def flush_now(self) -> None:
+        """Synchronously write any pending task changes."""
+        if self._save_timer is not None:
+            self._save_timer.stop()
+            self._save_timer = None
+        if self._tasks_dirty:
+            save_tasks(self.tasks)
+            self._tasks_dirty = False
+
+    async def _flush_tasks_async(self) -> None:
+        """Encode pending changes here and write them from a worker thread."""
+        self._save_timer = None
+        if self._tasks_dirty:
+            generation, data = encode_tasks(self.tasks)
+            self._tasks_dirty = False
+            await asyncio.to_thread(write_tasks, generation, data)
 
     async def update_list_view(self) -> None:
         """Update the list view with current tasks."""
         if self.list_view is None:
             return
 
-        self.list_view.clear()
-        for index, task in enumerate(self.tasks):
-            item = TaskItem(task, index)
-            self.list_view.append(item)
-
-        self.list_view.refresh()
-        self.list_view.focus()
+        # Reuse the mounted rows; only mount or remove the difference in length
+        index = self.list_view.index
+        self.list_view.index = None
+        rows = list(self.list_view.children)
+        for item, task in zip(rows, self.tasks):
+            item.rebind(task)
+        if len(rows) > len(self.tasks):
+            await self.list_view.remove_children(rows[len(self.tasks):])
+        elif len(self.tasks) > len(rows):
+            await self.list_view.extend(TaskItem(task) for task in self.tasks[len(rows):])
+        if index is not None and self.tasks:
+            self.list_view.index = min(index, len(self.tasks) - 1)
+
+    def _refresh_row(self, idx: int) -> None:
+        """Re-render a single row whose task changed in place."""
+        self.list_view.children[idx].update_content()
+
+    async def _insert_row(self, idx: int, task: Task) -> None:
+        """Mount a TaskItem for a newly inserted task."""
+        self.list_view.index = None
+        await self.list_view.insert(idx, [TaskItem(task)])
+
+    async def _remove_row(self, idx: int) -> None:
+        """Remove the TaskItem of a deleted task."""
+        self.list_view.index = None
+        await self.list_view.pop(idx)
+
+    def _swap_rows(self, i: int, j: int) -> None:
+        """Swap two rows by exchanging the tasks they display."""
+        children = self.list_view.children
+        children[i].rebind(self.tasks[i])
+        children[j].rebind(self.tasks[j])
+
+    def _move_row(self, src: int, dst: int) -> None:
+        """Move an existing TaskItem from src to dst without re-creating it."""
+        if src == dst:
+            return
+        self.list_view.index = None
+        children = self.list_view.children
+        item = children[src]
+        if dst < src:
+            self.list_view.move_child(item, before=children[dst])
+        else:
+            self.list_view.move_child(item, after=children[dst])
 
     def get_selected_index(self) -> int:
         """Return the currently selected task index or -1 if none."""
-        if self.list_view is None or self.list_view.index is None:
+        if self.list_view is None:
             return -1
-        return self.list_view.index
+        index = self.list_view.index
+        return -1 if index is None else index
 
     def add_log_entry(self, message: str):
         """Add a log entry to logs list and to the log panel."""
-        log_action(self.logs, message)
+        entry = log_action(self.logs, message)
         if self.log_panel:
-            self.log_panel.write(f"{self.logs[-1]}\n")
-
-    async def on_key(self, event: events.Key) -> None:
-        """Handle key events for the main application."""
-        if self._handling_task_screen or self._handling_review_screen:
-            return
+            self.log_panel.write(entry)
 
-        if event.key == "A":  # Add task ABOVE
-            await self.open_task_screen(insert_above=True)
-            return
-        elif event.key == "a":  # Add task BELOW
-            await self.open_task_screen(insert_above=False)
-            return
-        elif event.key == "j":
-            if self.list_view is not None:
-                self.list_view.action_cursor_down()
-            return
-        elif event.key == "k":
-            if self.list_view is not None:
-                self.list_view.action_cursor_up()
-            return
-        elif event.key == "J":
-            await self.move_task_down()
-            return
-        elif event.key == "K":
-            await self.move_task_up()
-            return
-        elif event.key == "d":
-            await self.delete_selected_task()
-            return
-        elif event.key == "r":
-            await self.resolve_or_unresolve_task()
-            return
-        elif event.key in ("e", "o", "enter"):
-            selected_index = self.get_selected_index()
-            if selected_index >= 0:
-                task_to_edit = self.tasks[selected_index]
-                await self.open_task_screen(task=task_to_edit, focus_description=False)
-            return
-        elif event.key == "E":
-            selected_index = self.get_selected_index()
-            if selected_index >= 0:
-                task_to_edit = self.tasks[selected_index]
-                await self.open_task_screen(task=task_to_edit, focus_description=True)
-            return
-        elif event.key == "L":
-            self.action_toggle_log()
-            return
-        elif event.key in ("q", "escape"):
-            self.exit()
-            return
-        elif event.key == "R":
-            screen = ReviewScreen(self.tasks)
-            await self.push_screen(screen)
+    def add_log_entries(self, messages: List[str]) -> None:
+        """Add several log entries, writing them to the log panel in one batch."""
+        if not messages:
             return
+        logs = self.logs
+        entries = [log_action(logs, message) for message in messages]
+        if self.log_panel:
+            self.log_panel.write("\n".join(entries))
+
+    async def action_toggle_log(self) -> None:
+        """Show or hide the action log; the panel is only mounted while open."""
+        if self.log_panel is None:
+            self.log_panel = RichLog(id="log_panel", max_lines=self._LOG_PANEL_LINES)
+            await self.mount(self.log_panel)
+            if self.logs:
+                self.log_panel.write("\n".join(self.logs[-self._LOG_PANEL_LINES:]))
+        else:
+            await self.log_panel.remove()
+            self.log_panel = None
+
+    def check_action(self, action: str, parameters: tuple) -> Optional[bool]:
+        """Disable main list bindings while a task or review screen is active."""
+        if action in self._MAIN_ACTIONS:
+            return not self._active_modals
+        return True
+
+    def action_exit_app(self):
+        self.exit()
+
+    async def action_add_above(self):
+        await self.open_task_screen(insert_above=True)
+
+    async def action_add_below(self):
+        await self.open_task_screen(insert_above=False)
+
+    def action_cursor_down(self):
+        if self.list_view is not None:
+            self.list_view.action_cursor_down()
+
+    def action_cursor_up(self):
+        if self.list_view is not None:
+            self.list_view.action_cursor_up()
+
+    async def action_edit_title(self):
+        selected_index = self.get_selected_index()
+        if selected_index >= 0:
+            task_to_edit = self.tasks[selected_index]
+            await self.open_task_screen(task=task_to_edit, focus_description=False)
+
+    async def action_edit_description(self):
+        selected_index = self.get_selected_index()
+        if selected_index >= 0:
+            task_to_edit = self.tasks[selected_index]
+            await self.open_task_screen(task=task_to_edit, focus_description=True)
+
+    async def action_review(self):
+        screen = ReviewScreen(self.tasks)
+        await self.push_screen(screen)
 
-    async def move_task_up(self):
+    async def action_move_up(self):
         idx = self.get_selected_index()
         if idx <= 0:
             return
         self.tasks[idx], self.tasks[idx - 1] = self.tasks[idx - 1], self.tasks[idx]
-        save_tasks(self.tasks)
-        await self.update_list_view()
-        self.post_message(self.MoveCursor(idx - 1))
+        self._mark_dirty_tasks()
+        self._swap_rows(idx, idx - 1)
+        self._move_cursor(idx - 1)
 
-    async def move_task_down(self):
+    async def action_move_down(self):
         idx = self.get_selected_index()
         if idx == -1 or idx >= len(self.tasks) - 1:
             return
         self.tasks[idx], self.tasks[idx + 1] = self.tasks[idx + 1], self.tasks[idx]
-        save_tasks(self.tasks)
-        await self.update_list_view()
-        self.post_message(self.MoveCursor(idx + 1))
-
-    class MoveCursor(events.Message):
-        """Message to move cursor to specific position."""
-        def __init__(self, target_index: int) -> None:
-            super().__init__()
-            self.target_index = target_index
+        self._mark_dirty_tasks()
+        self._swap_rows(idx, idx + 1)
+        self._move_cursor(idx + 1)
 
-    async def on_todo_app_move_cursor(self, message: MoveCursor) -> None:
+    def _move_cursor(self, index: int) -> None:
+        """Highlight the given row and keep focus on the list."""
         if self.list_view:
-            self.list_view.index = message.target_index
-            self.list_view.focus()
+            self.list_view.index = index
+            if not self.list_view.has_focus:
+                self.list_view.focus()
 
     async def open_task_screen(self, 
                                task: Optional[Task] = None, 
                                insert_above: bool = False, 
                                focus_description: bool = False):
         """Open the task screen for adding or editing a task."""
-        self._handling_task_screen = True
+        self._active_modals.add("task")
         self._editing_task = task
         self._insert_above = insert_above
 
@@ -219,7 +334,7 @@ class TodoApp(App):
 
     async def on_task_screen_result(self, message: TaskScreenResult) -> None:
         """Handle the result from TaskScreen."""
-        if self._handling_review_screen:
+        if "review" in self._active_modals:
             return
 
         try:
@@ -235,6 +350,7 @@ class TodoApp(App):
                 task_title = self._editing_task.title
                 target_index = selected_index
                 self._editing_task = None
+                self._refresh_row(target_index)
                 action = "Edited"
             else:
                 new_task = Task(
@@ -249,39 +365,36 @@ class TodoApp(App):
                     insert_idx = (selected_index + 1) if selected_index >= 0 else len(self.tasks)
                     self.tasks.insert(insert_idx, new_task)
                     target_index = insert_idx
+                await self._insert_row(target_index, new_task)
                 task_title = new_task.title
                 action = "Added"
 
-            save_tasks(self.tasks)
-            await self.update_list_view()
+            self._mark_dirty_tasks()
             self.add_log_entry(f"{action} task: '{task_title}'")
-            self.post_message(self.MoveCursor(target_index))
+            self._move_cursor(target_index)
 
         finally:
-            self.post_message(TaskScreenComplete())
+            self._active_modals.discard("task")
 
-    async def on_task_screen_complete(self, message: TaskScreenComplete) -> None:
-        self._handling_task_screen = False
-
-    async def delete_selected_task(self):
+    async def action_delete_task(self):
         idx = self.get_selected_index()
         if idx == -1:
             return
         task = self.tasks[idx]
         self.tasks.pop(idx)
-        save_tasks(self.tasks)
-        await self.update_list_view()
+        self._mark_dirty_tasks()
+        await self._remove_row(idx)
 
         if len(self.tasks) > 0:
             new_index = min(idx, len(self.tasks) - 1)
-            self.post_message(self.MoveCursor(new_index))
+            self._move_cursor(new_index)
         else:
             if self.list_view:
                 self.list_view.index = None
 
         self.add_log_entry(f"Deleted task: '{task.title}'")
 
-    async def resolve_or_unresolve_task(self):
+    async def action_resolve_task(self):
         idx = self.get_selected_index()
         if idx == -1:
             return
@@ -294,6 +407,7 @@ class TodoApp(App):
             self.tasks.pop(idx)
             # Add it to the end
             self.tasks.append(task)
+            row = len(self.tasks) - 1
             
             # Calculate new cursor position
             # If we're at the last item, move cursor up
@@ -303,6 +417,7 @@ class TodoApp(App):
             self.tasks.pop(idx)
             # Add it to the beginning
             self.tasks.insert(0, task)
+            row = 0
             # Focus on the unresolved task at the top
             new_index = 0
             
@@ -310,70 +425,93 @@ class TodoApp(App):
             f"{'Resolved' if task.resolved else 'Unresolved'} task: '{task.title}'"
         )
         
-        save_tasks(self.tasks)
-        await self.update_list_view()
+        self._mark_dirty_tasks()
+        self._move_row(idx, row)
+        self._refresh_row(row)
         
-        # Move cursor via message
-        self.post_message(self.MoveCursor(new_index))
+        self._move_cursor(new_index)
 
     def on_unmount(self) -> None:
-        """Called before the app closes; ensure tasks/logs are saved."""
-        save_tasks(self.tasks)
-        save_logs(self.logs)
+        """Called before the app closes; ensure tasks and logs are saved."""
+        self.flush_now()
+        close_log()
 
     async def on_shutdown_request(self) -> None:
         """Intercept shutdown to ensure data is saved."""
-        save_tasks(self.tasks)
-        save_logs(self.logs)
+        self.flush_now()
+        flush_log()
         await self.shutdown()
 
     async def push_screen(self, screen: Screen, *args, **kwargs) -> None:
         """Override push_screen to track which screen we're handling."""
         if isinstance(screen, TaskScreen):
-            self._handling_task_screen = True
+            self._active_modals.add("task")
         elif isinstance(screen, ReviewScreen):
-            self._handling_review_screen = True
+            self._active_modals.add("review")
+            self._review_tasks_version = self._tasks_version
         await super().push_screen(screen, *args, **kwargs)
 
     def pop_screen(self) -> None:
         """Override pop_screen to reset screen handling flags and refresh view if needed."""
         screen = self.screen
         if isinstance(screen, TaskScreen):
-            self._handling_task_screen = False
+            self._active_modals.discard("task")
         elif isinstance(screen, ReviewScreen):
-            self._handling_review_screen = False
-            # Refresh the entire list view when returning from review mode
-            self.call_after_refresh(self.update_list_view)
+            self._active_modals.discard("review")
+            # Refresh the list view only if tasks were edited during review
+            if self._tasks_version != self._review_tasks_version:
+                self.call_after_refresh(self.update_list_view)
         super().pop_screen()
 
     async def on_todo_app_screen_handling_state(self, message: "TodoApp.ScreenHandlingState") -> None:
         """Handle screen state changes."""
-        self.logger.debug(f"Before state change: handling_review={self._handling_review_screen}, handling_task={self._handling_task_screen}")
-        if message.screen_type == "task":
-            self._handling_task_screen = message.is_handling
-        elif message.screen_type == "review":
-            self._handling_review_screen = message.is_handling
-        self.logger.debug(f"After state change: screen_type={message.screen_type}, is_handling={message.is_handling}, handling_review={self._handling_review_screen}, handling_task={self._handling_task_screen}")
+        self.logger.debug("Before state change: active_modals=%s", self._active_modals)
+        if message.screen_type in ("task", "review"):
+            if message.is_handling:
+                self._active_modals.add(message.screen_type)
+            else:
+                self._active_modals.discard(message.screen_type)
+        self.logger.debug(
+            "After state change: screen_type=%s, is_handling=%s, active_modals=%s",
+            message.screen_type, message.is_handling, self._active_modals,
+        )
+
+    def on_review_screen_task_edited(self, message: ReviewScreen.TaskEdited) -> None:
+        """A task was edited in place from the review screen."""
+        self._mark_dirty_tasks()
 
     async def on_review_screen_review_complete(self, message: ReviewScreen.ReviewComplete) -> None:
         """Handle the completion of review with decisions."""
-        for task, decision in message.decisions.items():
-            if decision == ReviewDecision.DELETE:
-                # Remove task from list
-                self.tasks.remove(task)
-                self.add_log_entry(f"Deleted task: '{task.title}'")
-            elif decision == ReviewDecision.REOPEN:
-                # Unresolve and move to top
+        if not len(message.delete_mask) == len(message.reopen_mask) == len(self.tasks):
+            # The task list changed under the review; applying the masks would hit the wrong tasks
+            self.logger.warning(
+                "Ignoring review result for %d tasks, list now has %d",
+                len(message.delete_mask), len(self.tasks),
+            )
+            return
+        # One pass over the tasks: drop deleted ones, reopened ones go to the top
+        top = []
+        rest = []
+        log_messages = []
+        for task, delete, reopen in zip(self.tasks, message.delete_mask, message.reopen_mask):
+            if delete:
+                log_messages.append(f"Deleted task: '{task.title}'")
+            elif reopen:
                 task.resolved = False
-                self.tasks.remove(task)
-                self.tasks.insert(0, task)
-                self.add_log_entry(f"Reopened task: '{task.title}'")
-            # KEEP decision requires no action
-        
-        save_tasks(self.tasks)
-        await self.update_list_view()
-        
+                top.append(task)
+                log_messages.append(f"Reopened task: '{task.title}'")
+            else:
+                rest.append(task)
+        self.add_log_entries(log_messages)
+
+        if top or len(rest) != len(self.tasks):
+            # Reopened tasks used to be moved to the top one at a time, last one first
+            top.reverse()
+            self.tasks[:] = top + rest
+            self._mark_dirty_tasks()
+            await self.update_list_view()
+
         # Focus first item if any tasks remain
         if self.tasks and self.list_view:
-            self.post_message(self.MoveCursor(0))
+            self._move_cursor(0)
 
@@ -0,0 +1,62 @@
+import importlib
+import os
+import tempfile
+import unittest
+
+from assistant import persistence
+from assistant.data_model import Task
+
+
+def launch():
+    """Reload persistence so module state starts fresh, like a new process."""
+    return importlib.reload(persistence)
+
+
+class CorruptTasksFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def titles(self, tasks):
+        return [t.title for t in tasks]
+
+    def test_backup_survives_corrupt_file_and_restarts(self):
+        p = launch()
+        p.save_tasks([Task("a")])
+        p.save_tasks([Task("a"), Task("b")])  # tasks.json.bak now holds [a]
+        with open(p.TASKS_FILE, "wb") as f:
+            f.write(b"{not json")
+
+        p = launch()
+        self.assertEqual(self.titles(p.load_tasks()), ["a"])
+
+        # Nothing edited: the next launch still finds the recovered tasks
+        p = launch()
+        self.assertEqual(self.titles(p.load_tasks()), ["a"])
+
+        # Two saves later the backup is the previous save, not the empty past
+        p = launch()
+        p.load_tasks()
+        p.save_tasks([Task("a"), Task("c")])
+        p.save_tasks([Task("a"), Task("c"), Task("d")])
+        p = launch()
+        self.assertEqual(self.titles(p.load_tasks()), ["a", "c", "d"])
+        with open(p.TASKS_FILE + ".bak", "rb") as f:
+            self.assertEqual(self.titles(p._parse_tasks(f.read())), ["a", "c"])
+
+    def test_corrupt_file_without_backup_loads_empty(self):
+        p = launch()
+        with open(p.TASKS_FILE, "wb") as f:
+            f.write(b"[1]")
+        self.assertEqual(p.load_tasks(), [])
+        self.assertFalse(os.path.exists(p.TASKS_FILE))
+
+
+if __name__ == "__main__":
+    unittest.main()